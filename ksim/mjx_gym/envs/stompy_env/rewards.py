@@ -8,8 +8,8 @@ from brax.mjx.base import State as mjxState
 
 from ksim.mjx_gym.envs.default_humanoid_env.rewards import (
     RewardDict,
-    RewardFunction,
     RewardParams,
+    TimeStepRewardFunction,
 )
 
 DEFAULT_REWARD_PARAMS: RewardParams = {
@@ -160,7 +160,7 @@ def ctrl_cost_reward_fn(
     return ctrl_cost, jp.array(1.0)
 
 
-reward_functions: dict[str, RewardFunction] = {
+reward_functions: dict[str, TimeStepRewardFunction] = {
     "rew_forward": forward_reward_fn,
     "rew_healthy": healthy_reward_fn,
     "rew_height": height_reward_fn,
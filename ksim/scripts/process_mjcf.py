@@ -23,7 +23,6 @@ We can then add collision meshes to parts as such:
 
 import argparse
 import logging
-import xml.dom.minidom
 import xml.etree.ElementTree as ET
 from pathlib import Path
 from typing import List, Union
@@ -198,11 +197,9 @@ DEFAULT_LIMITS = {
     },
 }
 
-
-def _pretty_print_xml(xml_string: str) -> str:
-    """Formats the provided XML string into a pretty-printed version."""
-    parsed_xml = xml.dom.minidom.parseString(xml_string)
-    return parsed_xml.toprettyxml(indent="  ")
+_STANDING_KEYS = frozenset(DEFAULT_STANDING)
+_LIMIT_KEYS = tuple(DEFAULT_LIMITS)
+_DEFAULT_STANDING_STR = {k: str(v) for k, v in DEFAULT_STANDING.items()}
 
 
 class Sim2SimRobot(mjcf.Robot):
@@ -215,40 +212,35 @@ class Sim2SimRobot(mjcf.Robot):
 
         if add_floor:
             asset = root.find("asset")
-            asset.append(
-                ET.Element(
-                    "texture",
-                    name="texplane",
-                    type="2d",
-                    builtin="checker",
-                    rgb1=".0 .0 .0",
-                    rgb2=".8 .8 .8",
-                    width="100",
-                    height="108",
-                )
+            ET.SubElement(
+                asset,
+                "texture",
+                name="texplane",
+                type="2d",
+                builtin="checker",
+                rgb1=".0 .0 .0",
+                rgb2=".8 .8 .8",
+                width="100",
+                height="108",
             )
-            asset.append(
-                ET.Element(
-                    "material",
-                    name="matplane",
-                    reflectance="0.",
-                    texture="texplane",
-                    texrepeat="1 1",
-                    texuniform="true",
-                )
+            ET.SubElement(
+                asset,
+                "material",
+                name="matplane",
+                reflectance="0.",
+                texture="texplane",
+                texrepeat="1 1",
+                texuniform="true",
             )
-            asset.append(ET.Element("material", name="visualgeom", rgba="0.5 0.9 0.2 1"))
+            ET.SubElement(asset, "material", name="visualgeom", rgba="0.5 0.9 0.2 1")
 
         compiler = root.find("compiler")
         if self.compiler is not None:
             compiler = self.compiler.to_xml(compiler)
 
         worldbody = root.find("worldbody")
-        # List to store items to be moved to the new root body
-        items_to_move = []
         # Gather all children (geoms and bodies) that need to be moved under the new root body
-        for element in worldbody:
-            items_to_move.append(element)
+        items_to_move = list(worldbody)
 
         new_root_body = mjcf.Body(name="root", pos=(0, 0, STOMPY_HEIGHT), quat=(1, 0, 0, 0)).to_xml()
         # Add joints to all the movement of the base
@@ -267,6 +259,8 @@ class Sim2SimRobot(mjcf.Robot):
 
         # Add the new root body to the worldbody
         worldbody.append(new_root_body)
+        # The lights and ground go at the front of the worldbody, so they are
+        # inserted rather than added with SubElement, which can only append
         worldbody.insert(
             0,
             mjcf.Light(
@@ -300,26 +294,28 @@ class Sim2SimRobot(mjcf.Robot):
                 ).to_xml(),
             )
 
-        motors: List[mjcf.Motor] = []
-        sensor_pos: List[mjcf.Actuatorpos] = []
-        sensor_vel: List[mjcf.Actuatorvel] = []
-        sensor_frc: List[mjcf.Actuatorfrc] = []
         # Create motors and sensors for the joints
         joints = list(root.findall("joint"))
-        for joint in DEFAULT_LIMITS.keys():
-            if joint in DEFAULT_STANDING.keys():
-                motors.append(
-                    mjcf.Motor(
-                        name=joint,
-                        joint=joint,
-                        gear=1,
-                        ctrlrange=(-200, 200),
-                        ctrllimited=True,
-                    )
-                )
-                sensor_pos.append(mjcf.Actuatorpos(name=joint + "_p", actuator=joint, user="13"))
-                sensor_vel.append(mjcf.Actuatorvel(name=joint + "_v", actuator=joint, user="13"))
-                sensor_frc.append(mjcf.Actuatorfrc(name=joint + "_f", actuator=joint, user="13", noise=0.001))
+        active = [joint for joint in _LIMIT_KEYS if joint in _STANDING_KEYS]
+        motors: List[mjcf.Motor] = [
+            mjcf.Motor(
+                name=joint,
+                joint=joint,
+                gear=1,
+                ctrlrange=(-200, 200),
+                ctrllimited=True,
+            )
+            for joint in active
+        ]
+        sensor_pos: List[mjcf.Actuatorpos] = [
+            mjcf.Actuatorpos(name=joint + "_p", actuator=joint, user="13") for joint in active
+        ]
+        sensor_vel: List[mjcf.Actuatorvel] = [
+            mjcf.Actuatorvel(name=joint + "_v", actuator=joint, user="13") for joint in active
+        ]
+        sensor_frc: List[mjcf.Actuatorfrc] = [
+            mjcf.Actuatorfrc(name=joint + "_f", actuator=joint, user="13", noise=0.001) for joint in active
+        ]
 
         # root = self.add_joint_limits(root, fixed=False)
 
@@ -329,16 +325,12 @@ class Sim2SimRobot(mjcf.Robot):
 
         # Add imus
         sensors = root.find("sensor")
-        sensors.extend(
-            [
-                ET.Element("framequat", name="orientation", objtype="site", noise="0.001", objname="imu"),
-                ET.Element("gyro", name="angular-velocity", site="imu", noise="0.005", cutoff="34.9"),
-                # ET.Element("framepos", name="position", objtype="site", noise="0.001", objname="imu"),
-                # ET.Element("velocimeter", name="linear-velocity", site="imu", noise="0.001", cutoff="30"),
-                # ET.Element("accelerometer", name="linear-acceleration", site="imu", noise="0.005", cutoff="157"),
-                # ET.Element("magnetometer", name="magnetometer", site="imu"),
-            ]
-        )
+        ET.SubElement(sensors, "framequat", name="orientation", objtype="site", noise="0.001", objname="imu")
+        ET.SubElement(sensors, "gyro", name="angular-velocity", site="imu", noise="0.005", cutoff="34.9")
+        # ET.SubElement(sensors, "framepos", name="position", objtype="site", noise="0.001", objname="imu")
+        # ET.SubElement(sensors, "velocimeter", name="linear-velocity", site="imu", noise="0.001", cutoff="30")
+        # ET.SubElement(sensors, "accelerometer", name="linear-acceleration", site="imu", noise="0.005", cutoff="157")
+        # ET.SubElement(sensors, "magnetometer", name="magnetometer", site="imu")
 
         root.insert(
             1,
@@ -376,36 +368,36 @@ class Sim2SimRobot(mjcf.Robot):
         if add_reference_position:
             root = self.add_reference_position(root)
 
-        # Move gathered elements to the new root body
-        for item in items_to_move:
-            worldbody.remove(item)
-            new_root_body.append(item)
+        # Move gathered elements to the new root body, removing them all in one
+        # pass rather than calling `remove` (a linear scan) for each of them
+        moving = set(items_to_move)
+        worldbody[:] = [element for element in worldbody if element not in moving]
+        new_root_body.extend(items_to_move)
+
+        # The body structure is fixed from here on, so walk the tree only once
+        all_bodies = list(root.iter("body"))
 
         # add visual geom logic
-        for body in root.findall(".//body"):
-            original_geoms = list(body.findall("geom"))
-            for geom in original_geoms:
+        for body in all_bodies:
+            # Iterate in reverse so that inserting doesn't shift the remaining indices
+            for index, geom in reversed(list(enumerate(body))):
+                if geom.tag != "geom":
+                    continue
+                ga = geom.attrib
                 geom.set("class", "visualgeom")
                 # Create a new geom element
-                new_geom = ET.Element("geom")
-                new_geom.set("type", geom.get("type"))
-                new_geom.set("rgba", geom.get("rgba"))
-                new_geom.set("mesh", geom.get("mesh"))
-                if geom.get("pos"):
-                    new_geom.set("pos", geom.get("pos"))
-                if geom.get("quat"):
-                    new_geom.set("quat", geom.get("quat"))
-                new_geom.set("contype", "0")
-                new_geom.set("conaffinity", "0")
-                new_geom.set("group", "1")
-                new_geom.set("density", "0")
+                new_attrib = {"type": ga["type"], "rgba": ga["rgba"], "mesh": ga["mesh"]}
+                if ga.get("pos"):
+                    new_attrib["pos"] = ga["pos"]
+                if ga.get("quat"):
+                    new_attrib["quat"] = ga["quat"]
+                new_attrib.update(contype="0", conaffinity="0", group="1", density="0")
 
                 # Append the new geom to the body
-                index = list(body).index(geom)
-                body.insert(index + 1, new_geom)
+                body.insert(index + 1, ET.Element("geom", new_attrib))
 
         if remove_frc_range:
-            for body in root.findall(".//body"):
+            for body in all_bodies:
                 joints = list(body.findall("joint"))
                 for join in joints:
                     if "actuatorfrcrange" in join.attrib:
@@ -413,12 +405,12 @@ class Sim2SimRobot(mjcf.Robot):
 
     def add_reference_position(self, root: ET.Element) -> None:
         # Find all 'joint' elements
-        joints = root.findall(".//joint")
+        joints = list(root.iter("joint"))
 
-        default_standing = DEFAULT_STANDING
         for joint in joints:
-            if joint.get("name") in default_standing.keys():
-                joint.set("ref", str(default_standing[joint.get("name")]))
+            ref = _DEFAULT_STANDING_STR.get(joint.get("name"))
+            if ref is not None:
+                joint.set("ref", ref)
 
         return root
 
@@ -436,9 +428,9 @@ class Sim2SimRobot(mjcf.Robot):
     #     return root
 
     def save(self, path: Union[str, Path]) -> None:
-        rough_string = ET.tostring(self.tree.getroot(), "utf-8")
-        # Pretty print the XML
-        formatted_xml = _pretty_print_xml(rough_string)
+        # Pretty print the XML in place, rather than re-parsing it
+        ET.indent(self.tree, space="  ")
+        formatted_xml = ET.tostring(self.tree.getroot(), encoding="unicode")
         logger.info("XML:\n%s", formatted_xml)
         with open(path, "w") as f:
             f.write(formatted_xml)